@@ -5,10 +5,10 @@ AI趋势预测模块
 
 import os
 import json
+import time
 import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Dict, Optional
 import logging
 from dotenv import load_dotenv
 import openai
@@ -267,7 +267,6 @@ class AIPredictor:
                 results[symbol] = prediction
                 
                 # API调用间隔，避免频率限制
-                import time
                 time.sleep(1)
                 
             except Exception as e:
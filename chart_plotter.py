@@ -9,9 +9,7 @@ from matplotlib.figure import Figure
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
-import numpy as np
-from datetime import datetime
-from typing import Optional, Tuple, List
+from typing import Tuple, List
 import logging
 
 logger = logging.getLogger(__name__)
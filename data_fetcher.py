@@ -6,8 +6,7 @@
 import requests
 import pandas as pd
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List
 import logging
 import os
 # 配置日志
@@ -5,7 +5,6 @@
 """
 
 import os
-import sys
 import logging
 from datetime import datetime
 
@@ -203,7 +202,7 @@ def demo_ai_prediction(data):
         # 保存预测结果
         import json
         with open('/workspace/demo_prediction.json', 'w', encoding='utf-8') as f:
-            json.dump(prediction, f, ensure_ascii=False, indent=2)
+            f.write(json.dumps(prediction, ensure_ascii=False, indent=2))
         print("\n预测结果已保存到: demo_prediction.json")
         
     except Exception as e:
@@ -5,7 +5,7 @@
 
 import pandas as pd
 import numpy as np
-from typing import Tuple, Optional
+from typing import Tuple
 import logging
 
 logger = logging.getLogger(__name__)